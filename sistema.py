@@ -6,7 +6,26 @@ contribuindo para o uso consciente e sustentável dos recursos hídricos.
 """
 
 from abc import ABC, abstractmethod
+from array import array
 from datetime import datetime
+from time import time
+
+
+# Marca a posição da coluna de instantes cujo registro tem data informada
+_SEM_INSTANTE = float("nan")
+
+# Modelos de texto preparados uma vez e reutilizados nas listagens
+_FMT_TOTAL = "{nome}: {total}L".format
+_FMT_ESTATISTICAS = (
+    "\n{nome}:\n"
+    "  Total consumido: {total}L\n"
+    "  Média de consumo: {media:.2f}L\n"
+    "  Quantidade de registros: {quantidade_registros}"
+).format
+_FMT_EXTREMOS = (
+    "  Maior consumo: {maior_consumo}L\n"
+    "  Menor consumo: {menor_consumo}L"
+).format
 
 
 class Pessoa(ABC):
@@ -15,6 +34,8 @@ class Pessoa(ABC):
     Implementa encapsulamento com atributo privado.
     """
     
+    __slots__ = ("__nome",)
+    
     def __init__(self, nome):
         """
         Inicializa uma pessoa com nome.
@@ -39,9 +60,15 @@ class Usuario(Pessoa):
     """
     Classe que representa um usuário residencial.
     Herda de Pessoa e implementa polimorfismo.
-    Demonstra agregação com a lista de consumos.
+    Demonstra agregação com os consumos, guardados em colunas paralelas
+    (valores e datas) em vez de uma lista de objetos Consumo.
     """
     
+    __slots__ = (
+        "__tipo", "__valores", "__instantes", "__datas",
+        "__total", "__maior", "__menor",
+    )
+    
     def __init__(self, nome, tipo="Residencial"):
         """
         Inicializa um usuário.
@@ -52,7 +79,16 @@ class Usuario(Pessoa):
         """
         super().__init__(nome)
         self.__tipo = tipo
-        self.__consumos = []  # Agregação: usuário possui consumos
+        # Agregação: usuário possui consumos, armazenados em colunas
+        self.__valores = array("d")  # Valores contíguos em float64
+        # Datas informadas pelo chamador, mantidas como foram passadas (ou None);
+        # só quando não há data o instante atual é guardado como timestamp
+        self.__instantes = array("d")
+        self.__datas = []
+        # Estatísticas acumuladas, atualizadas a cada novo consumo
+        self.__total = 0
+        self.__maior = float("-inf")
+        self.__menor = float("inf")
     
     @property
     def tipo(self):
@@ -61,17 +97,78 @@ class Usuario(Pessoa):
     
     @property
     def consumos(self):
-        """Retorna a lista de consumos do usuário."""
-        return self.__consumos
+        """Gera os consumos do usuário como objetos Consumo, sob demanda."""
+        colunas = zip(self.__valores, self.__datas, self.__instantes)
+        for valor, data, instante in colunas:
+            if data is None:
+                yield Consumo.de_timestamp(valor, instante)
+            else:
+                yield Consumo(valor, data)
+    
+    @property
+    def quantidade_consumos(self):
+        """Retorna a quantidade de consumos registrados."""
+        return len(self.__valores)
     
-    def adicionar_consumo(self, consumo):
+    def adicionar_consumo(self, valor, data=None):
         """
         Adiciona um registro de consumo ao usuário.
         
         Args:
-            consumo (Consumo): Objeto do tipo Consumo
+            valor (float): Quantidade de água consumida em litros
+            data (datetime, optional): Data do consumo. Se None, usa data/hora atual
         """
-        self.__consumos.append(consumo)
+        # Mesmo tipo guardado na coluna, para estatísticas e listagem coincidirem
+        valor = float(valor)
+        self.__valores.append(valor)
+        self.__datas.append(data)
+        self.__instantes.append(time() if data is None else _SEM_INSTANTE)
+        self.__total += valor
+        if valor > self.__maior:
+            self.__maior = valor
+        if valor < self.__menor:
+            self.__menor = valor
+    
+    def adicionar_consumos(self, valores, datas=None):
+        """
+        Adiciona vários registros de consumo de uma só vez (carga em lote).
+        
+        Args:
+            valores (iterable): Quantidades de água consumidas em litros
+            datas (iterable, optional): Datas de cada consumo. Se None, todos
+                recebem a data/hora atual; o mesmo vale para cada data None
+        
+        Raises:
+            ValueError: Se a quantidade de datas difere da de valores
+        """
+        # float() em cada valor, como em adicionar_consumo
+        novos = array("d", (float(v) for v in valores))
+        if len(novos) == 0:
+            return
+        if datas is None:
+            datas = [None] * len(novos)
+            instantes = array("d", [time()]) * len(novos)
+        else:
+            datas = list(datas)
+            if len(datas) != len(novos):
+                raise ValueError("A quantidade de datas deve ser igual à de valores.")
+            # Como em adicionar_consumo, só registros sem data usam o instante atual
+            agora = time()
+            instantes = array(
+                "d", (agora if d is None else _SEM_INSTANTE for d in datas)
+            )
+        
+        self.__valores.extend(novos)
+        self.__datas.extend(datas)
+        self.__instantes.extend(instantes)
+        # Soma na mesma ordem da carga registro a registro, para o total
+        # não depender da forma de carga
+        total = self.__total
+        for valor in novos:
+            total += valor
+        self.__total = total
+        self.__maior = max(self.__maior, max(novos))
+        self.__menor = min(self.__menor, min(novos))
     
     def exibir_info(self):
         """Implementação polimórfica: exibe informações do usuário."""
@@ -79,12 +176,13 @@ class Usuario(Pessoa):
     
     def calcular_total(self):
         """
-        Calcula o consumo total de água do usuário.
+        Retorna o consumo total de água do usuário, acumulado
+        a cada registro em adicionar_consumo.
         
         Returns:
             float: Total de litros consumidos
         """
-        return sum(c.valor for c in self.__consumos)
+        return self.__total
     
     def obter_estatisticas(self):
         """
@@ -93,7 +191,8 @@ class Usuario(Pessoa):
         Returns:
             dict: Dicionário com estatísticas de consumo
         """
-        if len(self.__consumos) == 0:
+        quantidade = len(self.__valores)
+        if quantidade == 0:
             return {
                 "total": 0,
                 "media": 0,
@@ -102,13 +201,12 @@ class Usuario(Pessoa):
                 "menor_consumo": 0
             }
         
-        valores = [c.valor for c in self.__consumos]
         return {
-            "total": sum(valores),
-            "media": sum(valores) / len(valores),
-            "quantidade_registros": len(valores),
-            "maior_consumo": max(valores),
-            "menor_consumo": min(valores)
+            "total": self.__total,
+            "media": self.__total / quantidade,
+            "quantidade_registros": quantidade,
+            "maior_consumo": self.__maior,
+            "menor_consumo": self.__menor
         }
 
 
@@ -118,6 +216,8 @@ class UsuarioComercial(Usuario):
     Demonstra herança multinível: Pessoa -> Usuario -> UsuarioComercial.
     """
     
+    __slots__ = ("__cnpj",)
+    
     def __init__(self, nome, cnpj):
         """
         Inicializa um usuário comercial.
@@ -138,8 +238,11 @@ class Consumo:
     """
     Classe que representa um registro de consumo de água.
     Encapsula informações sobre valor e data do consumo.
+    Usuario cria instâncias apenas para exibição, a partir de suas colunas.
     """
     
+    __slots__ = ("__valor", "__instante", "__data")
+    
     def __init__(self, valor, data=None):
         """
         Inicializa um registro de consumo.
@@ -149,7 +252,26 @@ class Consumo:
             data (datetime, optional): Data do consumo. Se None, usa data/hora atual
         """
         self.__valor = valor
-        self.__data = data if data else datetime.now()
+        # Sem data informada, guarda só o instante atual; a data informada
+        # é mantida como foi passada
+        self.__instante = time() if data is None else _SEM_INSTANTE
+        self.__data = data  # Se None, é criada no primeiro acesso
+    
+    @classmethod
+    def de_timestamp(cls, valor, instante):
+        """
+        Cria um registro de consumo a partir de um timestamp POSIX,
+        sem construir o objeto datetime.
+        
+        Args:
+            valor (float): Quantidade de água consumida em litros
+            instante (float): Momento do consumo em segundos desde a época
+        """
+        consumo = cls.__new__(cls)
+        consumo.__valor = valor
+        consumo.__instante = instante
+        consumo.__data = None
+        return consumo
     
     @property
     def valor(self):
@@ -158,12 +280,14 @@ class Consumo:
     
     @property
     def data(self):
-        """Retorna a data do registro."""
+        """Retorna a data do registro, criada a partir do timestamp se preciso."""
+        if self.__data is None:
+            self.__data = datetime.fromtimestamp(self.__instante)
         return self.__data
     
     def __str__(self):
         """Representação em string do consumo."""
-        return f"{self.__valor}L em {self.__data.strftime('%d/%m/%Y %H:%M')}"
+        return f"{self.__valor}L em {self.data.strftime('%d/%m/%Y %H:%M')}"
 
 
 class Alerta(ABC):
@@ -172,6 +296,8 @@ class Alerta(ABC):
     Base para implementação de diferentes tipos de alertas (polimorfismo).
     """
     
+    _FATOR = 1  # Multiplicador do limite que dispara o alerta
+    
     def __init__(self, limite):
         """
         Inicializa um alerta com limite de consumo.
@@ -180,6 +306,7 @@ class Alerta(ABC):
             limite (float): Limite de consumo em litros
         """
         self._limite = limite  # Atributo protegido
+        self._gatilho = limite * self._FATOR  # Pré-calculado uma única vez
     
     @abstractmethod
     def verificar(self, consumo):
@@ -200,7 +327,7 @@ class AlertaSimples(Alerta):
     
     def verificar(self, consumo):
         """Verifica se o consumo está acima do limite."""
-        if consumo > self._limite:
+        if consumo > self._gatilho:
             return f"⚠️  CONSUMO ALTO: {consumo}L (Limite: {self._limite}L)"
         return None
 
@@ -208,9 +335,11 @@ class AlertaSimples(Alerta):
 class AlertaCritico(Alerta):
     """Implementação de alerta crítico para consumo muito alto."""
     
+    _FATOR = 1.5
+    
     def verificar(self, consumo):
         """Verifica se o consumo está 50% acima do limite."""
-        if consumo > self._limite * 1.5:
+        if consumo > self._gatilho:
             return f"🚨 CONSUMO CRÍTICO: {consumo}L (Limite: {self._limite}L)"
         return None
 
@@ -224,7 +353,12 @@ class GerenciadorConsumo:
     def __init__(self):
         """Inicializa o gerenciador com listas vazias."""
         self.__usuarios = []
+        # Índices para busca: nome exato e nome normalizado com casefold()
+        self.__por_nome_exato = {}
+        self.__por_nome_cf = {}
         self.__alertas = [AlertaSimples(200), AlertaCritico(200)]
+        # Último resultado de alertas por usuário: usuario -> (total, mensagens)
+        self.__cache_alertas = {}
     
     def adicionar_usuario(self, usuario):
         """
@@ -234,10 +368,18 @@ class GerenciadorConsumo:
             usuario (Usuario): Objeto do tipo Usuario ou UsuarioComercial
         """
         self.__usuarios.append(usuario)
+        # Mantém o primeiro usuário cadastrado com o nome, como na busca linear.
+        # O índice exato só recebe o nome que também é o primeiro no índice
+        # normalizado, para a busca não depender de maiúsculas e minúsculas.
+        chave = usuario.nome.casefold()
+        if chave not in self.__por_nome_cf:
+            self.__por_nome_cf[chave] = usuario
+            self.__por_nome_exato[usuario.nome] = usuario
     
     def buscar_usuario(self, nome):
         """
-        Busca um usuário pelo nome.
+        Busca um usuário pelo nome, sem diferenciar maiúsculas e minúsculas.
+        Tenta primeiro o nome exato e só normaliza o texto se não encontrar.
         
         Args:
             nome (str): Nome do usuário a buscar
@@ -245,10 +387,10 @@ class GerenciadorConsumo:
         Returns:
             Usuario ou None: Usuário encontrado ou None
         """
-        for usuario in self.__usuarios:
-            if usuario.nome.lower() == nome.lower():
-                return usuario
-        return None
+        usuario = self.__por_nome_exato.get(nome)
+        if usuario is None:
+            usuario = self.__por_nome_cf.get(nome.casefold())
+        return usuario
     
     def listar_usuarios(self):
         """Retorna a lista de todos os usuários."""
@@ -265,11 +407,17 @@ class GerenciadorConsumo:
             list: Lista de mensagens de alerta
         """
         total = usuario.calcular_total()
+        # Os alertas dependem só do total: se ele não mudou, reaproveita
+        cache = self.__cache_alertas.get(usuario)
+        if cache is not None and cache[0] == total:
+            return list(cache[1])
+        
         alertas_ativos = []
         for alerta in self.__alertas:
             msg = alerta.verificar(total)
             if msg:
                 alertas_ativos.append(msg)
+        self.__cache_alertas[usuario] = (total, tuple(alertas_ativos))
         return alertas_ativos
     
     def gerar_relatorio_geral(self):
@@ -286,12 +434,17 @@ class GerenciadorConsumo:
                 "media_por_usuario": 0
             }
         
-        consumo_total = sum(u.calcular_total() for u in self.__usuarios)
+        # Total de cada usuário calculado uma única vez para o relatório
+        totais = [u.calcular_total() for u in self.__usuarios]
+        consumo_total = sum(totais)
+        com_alerta = sum(
+            1 for t in totais if any(a.verificar(t) for a in self.__alertas)
+        )
         return {
             "total_usuarios": len(self.__usuarios),
             "consumo_total_sistema": consumo_total,
             "media_por_usuario": consumo_total / len(self.__usuarios),
-            "usuarios_com_alerta": sum(1 for u in self.__usuarios if len(self.verificar_alertas(u)) > 0)
+            "usuarios_com_alerta": com_alerta
         }
 
 
@@ -304,6 +457,17 @@ class SistemaMenu:
     def __init__(self):
         """Inicializa o sistema com um gerenciador de consumo."""
         self.__gerenciador = GerenciadorConsumo()  # Composição
+        # Dicionário de despacho: opção do menu -> método correspondente
+        self.__acoes = {
+            1: self.cadastrar_usuario_residencial,
+            2: self.cadastrar_usuario_comercial,
+            3: self.registrar_consumo,
+            4: self.ver_consumo,
+            5: self.calcular_consumo_total,
+            6: self.ver_alerta_consumo,
+            7: self.ver_estatisticas_detalhadas,
+            8: self.ver_relatorio_geral,
+        }
     
     def mostrar_menu(self):
         """Exibe o menu principal com todas as opções disponíveis."""
@@ -356,8 +520,7 @@ class SistemaMenu:
                 print("O consumo não pode ser negativo.")
                 return
             
-            consumo = Consumo(valor)
-            usuarios[indice].adicionar_consumo(consumo)
+            usuarios[indice].adicionar_consumo(valor)
             print(f"Consumo de {valor}L registrado para {usuarios[indice].nome}.")
         except ValueError:
             print("Erro: Digite um valor numérico válido.")
@@ -369,14 +532,15 @@ class SistemaMenu:
             print("Nenhum usuário cadastrado.")
             return
         
-        print("\nConsumos registrados:")
+        # Linhas acumuladas e escritas de uma só vez no final
+        saida = ["\nConsumos registrados:"]
         for usuario in usuarios:
-            print(f"\n{usuario.exibir_info()}")
-            if len(usuario.consumos) == 0:
-                print("  Nenhum consumo registrado")
+            saida.append(f"\n{usuario.exibir_info()}")
+            if usuario.quantidade_consumos == 0:
+                saida.append("  Nenhum consumo registrado")
             else:
-                for consumo in usuario.consumos:
-                    print(f"  - {consumo}")
+                saida.extend(f"  - {consumo}" for consumo in usuario.consumos)
+        print("\n".join(saida))
     
     def calcular_consumo_total(self):
         """Calcula e exibe o consumo total de cada usuário."""
@@ -385,10 +549,10 @@ class SistemaMenu:
             print("Nenhum usuário cadastrado.")
             return
         
-        print("\nConsumo total por usuário:")
+        saida = ["\nConsumo total por usuário:"]
         for usuario in usuarios:
-            total = usuario.calcular_total()
-            print(f"{usuario.nome}: {total}L")
+            saida.append(_FMT_TOTAL(nome=usuario.nome, total=usuario.calcular_total()))
+        print("\n".join(saida))
     
     def ver_alerta_consumo(self):
         """Verifica e exibe alertas de consumo excessivo."""
@@ -417,16 +581,13 @@ class SistemaMenu:
             print("Nenhum usuário cadastrado.")
             return
         
-        print("\n=== Estatísticas Detalhadas por Usuário ===")
+        saida = ["\n=== Estatísticas Detalhadas por Usuário ==="]
         for usuario in usuarios:
             stats = usuario.obter_estatisticas()  # Retorna dicionário
-            print(f"\n{usuario.nome}:")
-            print(f"  Total consumido: {stats['total']}L")
-            print(f"  Média de consumo: {stats['media']:.2f}L")
-            print(f"  Quantidade de registros: {stats['quantidade_registros']}")
+            saida.append(_FMT_ESTATISTICAS(nome=usuario.nome, **stats))
             if stats['quantidade_registros'] > 0:
-                print(f"  Maior consumo: {stats['maior_consumo']}L")
-                print(f"  Menor consumo: {stats['menor_consumo']}L")
+                saida.append(_FMT_EXTREMOS(**stats))
+        print("\n".join(saida))
     
     def ver_relatorio_geral(self):
         """Exibe relatório geral do sistema usando dicionários."""
@@ -450,34 +611,14 @@ class SistemaMenu:
             try:
                 opcao = int(input("\nEscolha uma opção: "))
                 
-                # Estrutura condicional (if/elif/else) para navegação no menu
-                if opcao == 1:
-                    self.cadastrar_usuario_residencial()
-                
-                elif opcao == 2:
-                    self.cadastrar_usuario_comercial()
-                
-                elif opcao == 3:
-                    self.registrar_consumo()
-                
-                elif opcao == 4:
-                    self.ver_consumo()
-                
-                elif opcao == 5:
-                    self.calcular_consumo_total()
-                
-                elif opcao == 6:
-                    self.ver_alerta_consumo()
-                
-                elif opcao == 7:
-                    self.ver_estatisticas_detalhadas()
-                
-                elif opcao == 8:
-                    self.ver_relatorio_geral()
-                
-                elif opcao == 9:
+                if opcao == 9:
                     print("Saindo do sistema...")
+                    continue
                 
+                # Navegação no menu por consulta ao dicionário de despacho
+                acao = self.__acoes.get(opcao)
+                if acao:
+                    acao()
                 else:
                     print("Opção inválida. Escolha entre 1 e 9.")
             